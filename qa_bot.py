@@ -1,32 +1,50 @@
 """
 Slack QA Bot — Always-online bot that:
 1. Listens for messages containing .wav URLs in specified channel(s)
-2. Downloads and transcribes audio via OpenAI Whisper (local, free, accurate)
+2. Downloads and transcribes audio via faster-whisper (local Whisper on CTranslate2, INT8)
 3. Analyzes dialogue quality via Ollama LLM
 4. Logs the analysis (ANALYZE_ONLY mode) or reacts + replies (production)
 
 Requirements:
-    pip install slack_bolt slack_sdk openai-whisper ollama python-dotenv requests
-
-    Whisper also needs ffmpeg:
-        brew install ffmpeg
+    pip install slack_bolt slack_sdk faster-whisper ollama python-dotenv requests
 
 Environment Variables (.env):
     SLACK_BOT_TOKEN=xoxp-...
     SLACK_APP_TOKEN=xapp-...
-    OLLAMA_MODEL=hf.co/bartowski/Llama-3.2-1B-Instruct-GGUF:Q8_0
+    OLLAMA_MODEL=hf.co/bartowski/Llama-3.2-1B-Instruct-GGUF:Q4_K_M
+    OLLAMA_QUANT=Q4_K_M      # Used only when OLLAMA_MODEL is unset: Q4_K_M (speed) or Q8_0 (accuracy)
+    OLLAMA_KEEP_ALIVE=24h    # How long Ollama keeps the model loaded between calls
     QA_CHANNEL_ID=C08S6HHRH8F
     WHISPER_MODEL=base       # Options: tiny, base, small, medium, large
+    WHISPER_DEVICE=cuda      # Optional: auto-detected (cuda if available, else cpu)
+    WHISPER_COMPUTE_TYPE=float16  # Optional: float16 on cuda, int8 on cpu by default
+    QA_CACHE_DIR=~/.cache/qa_bot  # Optional: transcript/analysis cache location
+    QA_CACHE_MAX_ENTRIES=500      # Optional: oldest entries are pruned past this
+    QA_WORKERS=4             # Optional: messages processed concurrently in the background
 """
 
 import os
 import re
+import json
+import queue
+import hashlib
 import logging
 import tempfile
+import threading
+import contextlib
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from typing import BinaryIO, Optional, Union
+
 import requests
+from requests.adapters import HTTPAdapter
 
 from dotenv import load_dotenv
-import whisper
+import ctranslate2
+import numpy as np
+from faster_whisper import WhisperModel
+from faster_whisper.audio import decode_audio
+from faster_whisper.vad import VadOptions, get_speech_timestamps
 import ollama
 
 from slack_bolt import App
@@ -38,17 +56,55 @@ load_dotenv()
 
 SLACK_BOT_TOKEN = os.environ["SLACK_BOT_TOKEN"]
 SLACK_APP_TOKEN = os.environ["SLACK_APP_TOKEN"]
-OLLAMA_MODEL = os.environ.get(
-    "OLLAMA_MODEL",
-    "hf.co/bartowski/Llama-3.2-1B-Instruct-GGUF:Q8_0",
+# Q4_K_M halves weight bandwidth vs Q8_0 (~750MB vs ~1.3GB) → ~1.5-2x faster CPU decode,
+# with negligible quality loss on this fixed emoji + 2-3 sentence task. Use Q8_0 for accuracy.
+OLLAMA_QUANT = os.environ.get("OLLAMA_QUANT") or "Q4_K_M"
+OLLAMA_MODEL = (
+    os.environ.get("OLLAMA_MODEL")
+    or f"hf.co/bartowski/Llama-3.2-1B-Instruct-GGUF:{OLLAMA_QUANT}"
 )
+# Keep the model resident between calls (Ollama unloads after 5 min idle by default)
+OLLAMA_KEEP_ALIVE = os.environ.get("OLLAMA_KEEP_ALIVE", "24h")
+# Grade + 2-3 sentences never needs more than this
+OLLAMA_NUM_PREDICT = 256
+# Once the grade icon has streamed in, stop generating this many characters later (~64 tokens)
+GRADE_TAIL_CHARS = 200
+# WAVs from one message are transcribed in parallel and graded in one LLM call, this many at a time
+BATCH_SIZE = 4
+# Context budget per call transcript (~6k chars, an ~8 min call); longer ones get truncated by Ollama
+TRANSCRIPT_TOKEN_BUDGET = 2048
+# Messages are processed by this many background workers; beyond JOB_QUEUE_SIZE waiting, new ones are dropped
+QA_WORKERS = int(os.environ.get("QA_WORKERS", "4"))
+JOB_QUEUE_SIZE = 32
 _raw_channel = os.environ.get("QA_CHANNEL_ID", "")
 QA_CHANNEL_ID = _raw_channel if _raw_channel.startswith("C") and len(_raw_channel) > 5 else ""
 
+# Transcript + analysis cache, keyed by SHA-256 of the WAV bytes (re-posted calls cost ~0ms)
+CACHE_DIR = Path(os.environ.get("QA_CACHE_DIR", "~/.cache/qa_bot")).expanduser()
+CACHE_MAX_ENTRIES = int(os.environ.get("QA_CACHE_MAX_ENTRIES", "500"))
+
+# Downloads up to this size stay in RAM; larger ones roll over to a temp file on disk
+SPOOL_MAX_BYTES = 8 * 1024 * 1024
+
+# Recordings with less voiced audio than this (silence, rings, misclicks) skip Whisper
+MIN_VOICED_SECONDS = 2.0
+# Whisper and its Silero VAD both work on 16kHz mono samples
+SAMPLE_RATE = 16000
+
 # Whisper model size: tiny (fastest) → base → small → medium → large (most accurate)
 # "base" is a good balance for phone calls. Use "small" or "medium" if you have GPU.
 WHISPER_MODEL_SIZE = os.environ.get("WHISPER_MODEL", "base")
 
+# FP16 on CUDA (Tensor Cores), INT8 on CPU (~4x faster than reference Whisper, ~1/3 the RAM)
+WHISPER_DEVICE = os.environ.get(
+    "WHISPER_DEVICE",
+    "cuda" if ctranslate2.get_cuda_device_count() > 0 else "cpu",
+)
+WHISPER_COMPUTE_TYPE = os.environ.get(
+    "WHISPER_COMPUTE_TYPE",
+    "float16" if WHISPER_DEVICE == "cuda" else "int8",
+)
+
 # ┌─────────────────────────────────────────────────────────────────────────────┐
 # │  ANALYZE_ONLY = True  →  downloads, transcribes, runs LLM, LOGS only      │
 # │                          NO reactions, NO replies in Slack                  │
@@ -67,8 +123,13 @@ logger.addHandler(file_handler)
 # ─── Load Whisper Model (once at startup) ────────────────────────────────────
 
 logger.info(f"Loading Whisper model '{WHISPER_MODEL_SIZE}'... (first run downloads it)")
-whisper_model = whisper.load_model(WHISPER_MODEL_SIZE)
-logger.info(f"Whisper model '{WHISPER_MODEL_SIZE}' loaded ✅")
+whisper_model = WhisperModel(
+    WHISPER_MODEL_SIZE,
+    device=WHISPER_DEVICE,
+    compute_type=WHISPER_COMPUTE_TYPE,
+    num_workers=BATCH_SIZE,  # Allow one concurrent transcribe() per batched WAV
+)
+logger.info(f"Whisper model '{WHISPER_MODEL_SIZE}' loaded on {WHISPER_DEVICE} ({WHISPER_COMPUTE_TYPE}) ✅")
 
 # ─── Slack App ───────────────────────────────────────────────────────────────
 
@@ -86,14 +147,23 @@ GRADE_EMOJI_MAP = {
     "❌": "x",
 }
 
+# One alternation over every grade icon → a single pass over the analysis text
+GRADE_EMOJI_PATTERN = re.compile(
+    "|".join(re.escape(icon) for icon in sorted(GRADE_EMOJI_MAP, key=len, reverse=True))
+)
+
 # ─── WAV URL Extraction ─────────────────────────────────────────────────────
 
 WAV_URL_PATTERN = re.compile(r'https?://[^\s<>|]+\.wav', re.IGNORECASE)
+SLACK_WAV_LINK_PATTERN = re.compile(r'<(https?://[^|>]+\.wav)[|>]', re.IGNORECASE)
 
 
 def extract_wav_urls(text: str) -> list[str]:
     """Extract .wav URLs from Slack message text (handles <url|label> format)."""
-    slack_links = re.findall(r'<(https?://[^|>]+\.wav)[|>]', text, re.IGNORECASE)
+    # Cheap substring check first: most chat messages never reach the regexes
+    if ".wav" not in text.lower():
+        return []
+    slack_links = SLACK_WAV_LINK_PATTERN.findall(text)
     if slack_links:
         return slack_links
     return WAV_URL_PATTERN.findall(text)
@@ -101,29 +171,70 @@ def extract_wav_urls(text: str) -> list[str]:
 
 # ─── Audio Processing ────────────────────────────────────────────────────────
 
-def download_wav(url: str, dest_path: str):
-    """Download a .wav file from a public URL."""
-    resp = requests.get(url, timeout=120)
-    resp.raise_for_status()
-    with open(dest_path, "wb") as f:
-        f.write(resp.content)
-    logger.info(f"  Downloaded {dest_path} ({len(resp.content):,} bytes)")
-
-
-def transcribe_wav(wav_path: str) -> str:
-    """Transcribe a WAV file using OpenAI Whisper (local model)."""
-    result = whisper_model.transcribe(
-        wav_path,
-        language="en",       # Force English for HVAC calls
-        fp16=False,          # CPU-safe; set True if you have CUDA GPU
+# One pooled session so TCP/TLS to the file host is reused across downloads
+http_session = requests.Session()
+_http_adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20)
+http_session.mount("https://", _http_adapter)
+http_session.mount("http://", _http_adapter)
+
+# Runs warm_up_llm in the background so the LLM load overlaps download + transcription
+warmup_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="qa-llm-warmup")
+# Download + transcribe the WAVs of one batch side by side
+transcribe_pool = ThreadPoolExecutor(max_workers=BATCH_SIZE, thread_name_prefix="qa-transcribe")
+
+
+def download_wav(url: str, dest: BinaryIO) -> str:
+    """Stream a .wav file from a public URL into `dest` (64KB chunks), rewound after.
+
+    Returns the SHA-256 hex digest of the downloaded bytes, hashed as they stream.
+    """
+    digest = hashlib.sha256()
+    with http_session.get(url, stream=True, timeout=120) as resp:
+        resp.raise_for_status()
+        resp.raw.decode_content = True  # Undo any Content-Encoding while copying
+        while chunk := resp.raw.read(65536):
+            dest.write(chunk)
+            digest.update(chunk)
+    size = dest.tell()
+    dest.seek(0)
+    logger.info(f"  Downloaded {url.split('/')[-1]} ({size:,} bytes)")
+    return digest.hexdigest()
+
+
+def speech_audio(audio: np.ndarray) -> np.ndarray:
+    """Voiced samples of SAMPLE_RATE mono audio, joined into one stream.
+
+    Same as faster-whisper's vad_filter (Silero VAD, then concatenate the speech), done
+    up front so the gate and Whisper share one VAD pass.
+    """
+    speech = get_speech_timestamps(audio, VadOptions())
+    if not speech:
+        return audio[:0]
+    return np.concatenate([audio[ts["start"]:ts["end"]] for ts in speech])
+
+
+def transcribe_wav(wav: Union[str, BinaryIO, np.ndarray], vad_filter: bool = True) -> str:
+    """Transcribe a WAV (path, file object or SAMPLE_RATE samples) using faster-whisper.
+
+    Pass vad_filter=False for audio already reduced to speech by speech_audio.
+    """
+    segments, _ = whisper_model.transcribe(
+        wav,
+        language="en",          # Force English for HVAC calls
+        beam_size=1,            # Greedy decoding; plenty for phone audio
+        vad_filter=vad_filter,  # Silero VAD trims dead air before decoding
     )
-    text = result.get("text", "").strip()
-    return text
+    # Segments are a lazy generator — decoding happens as we iterate
+    parts = []
+    for seg in segments:
+        parts.append(seg.text)
+        logger.debug(f"    [{seg.start:6.1f}s → {seg.end:6.1f}s] {seg.text.strip()}")
+    return "".join(parts).strip()
 
 
 # ─── LLM Analysis ────────────────────────────────────────────────────────────
 
-QA_PROMPT_TEMPLATE = """You are an extremely strict Quality Assurance Auditor for an AI phone agent (voice bot) that handles incoming customer calls for an HVAC/appliance repair company. You evaluate transcribed phone conversations between the AI agent and customers.
+QA_RUBRIC = """You are an extremely strict Quality Assurance Auditor for an AI phone agent (voice bot) that handles incoming customer calls for an HVAC/appliance repair company. You evaluate transcribed phone conversations between the AI agent and customers.
 
 GRADING SCALE — select exactly ONE primary grade:
 
@@ -174,46 +285,342 @@ STRICT EVALUATION RULES:
 - Short calls with transfer language = ↗️, do not overthink
 - If transcript is mostly empty or unintelligible = ❌ (cannot evaluate)
 
-TRANSCRIPT:
+"""
+
+QA_SUFFIX_TEMPLATE = """TRANSCRIPT:
 {transcript}
 
 YOUR GRADE AND JUSTIFICATION:"""
 
+QA_BATCH_SUFFIX_TEMPLATE = """You will evaluate {count} SEPARATE calls. Grade each call independently using the rules above.
+For each call, in order, output a line "=== Call N ===" followed by that call's grade and justification.
 
-def analyze_transcript(transcript: str) -> str:
-    """Send transcript to Ollama for QA analysis."""
-    prompt = QA_PROMPT_TEMPLATE.format(transcript=transcript)
-    response = ollama.generate(model=OLLAMA_MODEL, prompt=prompt)
-    return response["response"]
+{calls}
+
+YOUR GRADES AND JUSTIFICATIONS:"""
+
+# First turn of the primed conversation: the rubric alone, answered with a short ack
+QA_PRIMING_PROMPT = QA_RUBRIC + "Reply with just OK. The transcript to grade follows in the next message."
+
+BATCH_CALL_MARKER = re.compile(r'=+\s*Call\s+(\d+)\s*=+', re.IGNORECASE)
+
+
+def _fixed_num_ctx() -> int:
+    """Power of two covering the rubric + a full batch of transcripts and replies (~3 chars/token)."""
+    needed = len(QA_RUBRIC) // 3 + BATCH_SIZE * (TRANSCRIPT_TOKEN_BUDGET + OLLAMA_NUM_PREDICT)
+    num_ctx = 4096
+    while num_ctx < needed:
+        num_ctx *= 2
+    return num_ctx
+
+
+# One context size for priming, single and batched calls alike: Ollama reloads the model
+# (dropping its KV cache, primed rubric included) whenever num_ctx changes
+OLLAMA_NUM_CTX = _fixed_num_ctx()
+
+
+def llm_options(num_predict: int = OLLAMA_NUM_PREDICT) -> dict:
+    """Ollama options; num_ctx is always OLLAMA_NUM_CTX so the loaded model is reused."""
+    return {
+        "num_ctx": OLLAMA_NUM_CTX,
+        "num_predict": num_predict,
+        "temperature": 0.0,   # Deterministic grading
+    }
+
+
+# Ollama `context` tokens for the primed rubric turn; passed back so its prefill is skipped
+rubric_context: Optional[list[int]] = None
+_rubric_context_lock = threading.Lock()
+
+
+def primed_rubric_context() -> Optional[list[int]]:
+    """Prime the rubric once and return its context (None while Ollama is unreachable)."""
+    global rubric_context
+    with _rubric_context_lock:
+        if rubric_context is None:
+            try:
+                response = ollama.generate(
+                    model=OLLAMA_MODEL,
+                    prompt=QA_PRIMING_PROMPT,
+                    options=llm_options(num_predict=4),
+                    keep_alive=OLLAMA_KEEP_ALIVE,
+                )
+                rubric_context = response["context"]
+                logger.info(f"  🧠 Primed QA rubric context ({len(rubric_context)} tokens)")
+            except Exception as e:
+                logger.warning(f"  ⚠️ Ollama rubric priming failed: {e}")
+        return rubric_context
+
+
+def warm_up_llm():
+    """Load the model into memory and prime the rubric context."""
+    primed_rubric_context()
+
+
+def grading_request(suffix: str) -> dict:
+    """Prompt + context kwargs for ollama.generate: suffix on the primed rubric, or the full prompt."""
+    context = primed_rubric_context()
+    if context:
+        return {"prompt": suffix, "context": context}
+    return {"prompt": QA_RUBRIC + suffix}
+
+
+def analyze_transcript(transcript: str, on_grade=None) -> str:
+    """Send transcript to Ollama for QA analysis, streaming the response.
+
+    The grade icon leads the response, so `on_grade(emoji_names)` fires as soon as it
+    appears, and generation stops GRADE_TAIL_CHARS later (trimmed to the last sentence).
+    """
+    stream = ollama.generate(
+        model=OLLAMA_MODEL,
+        **grading_request(QA_SUFFIX_TEMPLATE.format(transcript=transcript)),
+        options=llm_options(),
+        keep_alive=OLLAMA_KEEP_ALIVE,
+        stream=True,
+    )
+    text = ""
+    deadline = None
+    try:
+        for chunk in stream:
+            text += chunk["response"]
+            if deadline is None and GRADE_EMOJI_PATTERN.search(text):
+                deadline = len(text) + GRADE_TAIL_CHARS
+                if on_grade:
+                    on_grade(extract_grade_emojis(text))
+            if deadline is not None and len(text) >= deadline:
+                text = text.rstrip()
+                if not text.endswith("."):
+                    # Drop the unfinished sentence, keeping everything up to the grade
+                    cut = text.rfind(". ", deadline - GRADE_TAIL_CHARS)
+                    if cut > 0:
+                        text = text[:cut + 1]
+                break
+    finally:
+        stream.close()  # Drops the connection → Ollama stops generating
+    return text
+
+
+def split_batch_analysis(text: str, count: int) -> list[str]:
+    """Split a batched response on its "=== Call N ===" markers ("" for missing calls)."""
+    analyses = [""] * count
+    parts = BATCH_CALL_MARKER.split(text)
+    for number, body in zip(parts[1::2], parts[2::2]):
+        n = int(number)
+        if 1 <= n <= count and not analyses[n - 1]:
+            analyses[n - 1] = body.strip()
+    return analyses
+
+
+def analyze_transcripts(transcripts: list[str], on_grade=None) -> list[str]:
+    """Grade several transcripts with a single Ollama call (shared rubric prefill).
+
+    `on_grade` is only used for a single transcript (see analyze_transcript).
+    """
+    if len(transcripts) == 1:
+        return [analyze_transcript(transcripts[0], on_grade=on_grade)]
+
+    calls = "\n\n".join(
+        f"=== Call {n} ===\n{transcript}" for n, transcript in enumerate(transcripts, 1)
+    )
+    suffix = QA_BATCH_SUFFIX_TEMPLATE.format(count=len(transcripts), calls=calls)
+    response = ollama.generate(
+        model=OLLAMA_MODEL,
+        **grading_request(suffix),
+        options=llm_options(OLLAMA_NUM_PREDICT * len(transcripts)),
+        keep_alive=OLLAMA_KEEP_ALIVE,
+    )
+    analyses = split_batch_analysis(response["response"], len(transcripts))
+
+    # Any call the model skipped or mangled gets graded on its own
+    return [
+        analysis if GRADE_EMOJI_PATTERN.search(analysis) else analyze_transcript(transcript)
+        for analysis, transcript in zip(analyses, transcripts)
+    ]
 
 
 def extract_grade_emojis(analysis: str) -> list[str]:
-    """Extract grade emoji names from the analysis text."""
-    found = []
-    for icon, emoji_name in GRADE_EMOJI_MAP.items():
-        if icon in analysis:
-            found.append(emoji_name)
-    return found
+    """Extract grade emoji names from the analysis text (first-seen order, deduped)."""
+    return list(dict.fromkeys(
+        GRADE_EMOJI_MAP[icon] for icon in GRADE_EMOJI_PATTERN.findall(analysis)
+    ))
+
+
+# ─── Result Cache ────────────────────────────────────────────────────────────
+
+@contextlib.contextmanager
+def atomic_write(dest: Path):
+    """Yield a text file created next to `dest` via mkstemp; os.replace it in on success.
+
+    On any error the temp file is removed, so failed writes never leave strays behind.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=dest.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            yield f
+        os.replace(tmp_path, dest)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_path)
+        raise
+
+
+def transcriber_settings() -> dict:
+    """Everything a cached transcript depends on; any change invalidates the entry."""
+    return {
+        "whisper_model": WHISPER_MODEL_SIZE,
+        "compute_type": WHISPER_COMPUTE_TYPE,
+        "min_voiced_seconds": MIN_VOICED_SECONDS,
+    }
+
+
+def load_cached_result(digest: str) -> Optional[dict]:
+    """Return the cached {"transcript", "analysis"} for a WAV digest, or None.
+
+    An entry transcribed under different Whisper/VAD settings is a miss (its analysis
+    was built on that transcript). A cached analysis from a different OLLAMA_MODEL is
+    dropped (transcript is kept).
+    """
+    path = CACHE_DIR / f"{digest}.json"
+    try:
+        entry = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if entry.get("transcriber") != transcriber_settings():
+        return None
+    with contextlib.suppress(OSError):
+        os.utime(path)  # Bump mtime → least-recently-used pruning
+    if entry.get("model") != OLLAMA_MODEL:
+        entry["analysis"] = None
+    return entry
+
+
+def _cache_mtime(path: Path) -> Optional[float]:
+    try:
+        return path.stat().st_mtime
+    except FileNotFoundError:  # Pruned by another thread meanwhile
+        return None
+
+
+def store_cached_result(digest: str, transcript: str, analysis: Optional[str] = None):
+    """Atomically write a cache entry, then prune to CACHE_MAX_ENTRIES by mtime."""
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        entry = {"transcript": transcript, "analysis": analysis, "model": OLLAMA_MODEL,
+                 "transcriber": transcriber_settings()}
+        with atomic_write(CACHE_DIR / f"{digest}.json") as f:
+            json.dump(entry, f, ensure_ascii=False)
+    except OSError as e:
+        logger.warning(f"  ⚠️ Cache write failed ({digest[:12]}): {e}")
+        return
+
+    try:
+        mtimes = [(m, p) for p in CACHE_DIR.glob("*.json") if (m := _cache_mtime(p)) is not None]
+        mtimes.sort()
+        for _, stale in mtimes[:max(0, len(mtimes) - CACHE_MAX_ENTRIES)]:
+            stale.unlink(missing_ok=True)
+    except OSError as e:
+        logger.warning(f"  ⚠️ Cache prune failed: {e}")
 
 
 # ─── Core Processing Pipeline ───────────────────────────────────────────────
 
-def process_wav_url(wav_url: str, message_ts: str = "", channel: str = "",
-                    say=None, client=None):
-    """Download → Transcribe → Analyze a single .wav URL."""
-    logger.info(f"  🎵 Processing WAV: {wav_url}")
+def fetch_call(wav_url: str) -> Optional[dict]:
+    """Download → Transcribe a single .wav URL, reusing cached results by content hash.
 
-    tmp_path = None
+    Returns {"digest", "transcript", "analysis"} (analysis is None unless cached),
+    or None on failure.
+    """
     try:
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
-            tmp_path = tmp.name
-        download_wav(wav_url, tmp_path)
+        # Small clips never touch disk; faster-whisper decodes straight from the file object
+        with tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_BYTES, suffix=".wav") as wav_file:
+            digest = download_wav(wav_url, wav_file)
+
+            cached = load_cached_result(digest)
+            if cached:
+                logger.info(f"  💾 Cache hit for {wav_url.split('/')[-1]} ({digest[:12]})")
+                return {"digest": digest, "transcript": cached["transcript"],
+                        "analysis": cached["analysis"]}
+
+            # Decode once; the VAD gate and Whisper share one VAD pass over the samples
+            audio = decode_audio(wav_file, sampling_rate=SAMPLE_RATE)
+
+        speech = speech_audio(audio)
+        voiced = len(speech) / SAMPLE_RATE
+        if voiced < MIN_VOICED_SECONDS:
+            logger.info(f"  🔇 Only {voiced:.1f}s of speech — skipping Whisper")
+            transcript = ""
+        else:
+            # Transcribe with Whisper
+            logger.info(f"  🎙️ Transcribing with Whisper... ({wav_url.split('/')[-1]})")
+            # Segment timestamps (debug log only) are relative to the joined speech
+            transcript = transcribe_wav(speech, vad_filter=False)
+
+        store_cached_result(digest, transcript)
+        return {"digest": digest, "transcript": transcript, "analysis": None}
 
-        # Transcribe with Whisper
-        logger.info("  🎙️ Transcribing with Whisper...")
-        transcript = transcribe_wav(tmp_path)
+    except Exception as e:
+        logger.exception(f"  ❌ Error processing {wav_url}: {e}")
+        return None
+
+
+def add_reaction(client, channel: str, message_ts: str, emoji_name: str):
+    try:
+        client.reactions_add(channel=channel, name=emoji_name, timestamp=message_ts)
+        logger.info(f"    ✅ Reacted: :{emoji_name}:")
+    except Exception as e:
+        logger.warning(f"    ⚠️ Reaction failed ({emoji_name}): {e}")
 
-        if not transcript or len(transcript.strip()) < 10:
+
+def report_analysis(wav_url: str, transcript: str, analysis: str,
+                    message_ts: str = "", channel: str = "", say=None, client=None,
+                    reacted: frozenset = frozenset()):
+    """Log the grade and, in production mode, react and reply in Slack.
+
+    Emoji names in `reacted` were already added while the analysis streamed.
+    """
+    grade_emojis = extract_grade_emojis(analysis)
+    grade_str = " ".join(f":{e}:" for e in grade_emojis) if grade_emojis else "???"
+
+    logger.info(f"  📊 GRADE: {grade_str}")
+    logger.info(f"  📊 ANALYSIS: {analysis}")
+
+    # Production mode: react and reply in Slack
+    if not ANALYZE_ONLY and client and say and message_ts and channel:
+        for emoji_name in grade_emojis:
+            if emoji_name not in reacted:
+                add_reaction(client, channel, message_ts, emoji_name)
+
+        short_url = wav_url.split("/")[-1] if "/" in wav_url else wav_url
+        reply_text = (
+            f"*QA Analysis for* `{short_url}`\n\n"
+            f"*Transcript:*\n>>> {transcript[:1500]}{'...' if len(transcript) > 1500 else ''}\n\n"
+            f"*Assessment:*\n{analysis}"
+        )
+        say(text=reply_text, thread_ts=message_ts)
+
+
+def process_wav_urls(wav_urls: list[str], message_ts: str = "", channel: str = "",
+                     say=None, client=None) -> list[Optional[str]]:
+    """Download → Transcribe → Analyze up to BATCH_SIZE .wav URLs with one LLM call.
+
+    Returns one result per URL: the analysis, "❌ No speech detected", or None on error.
+    """
+    for wav_url in wav_urls:
+        logger.info(f"  🎵 Processing WAV: {wav_url}")
+
+    # Hide the LLM cold start behind download + transcription
+    warmup_pool.submit(warm_up_llm)
+
+    calls = list(transcribe_pool.map(fetch_call, wav_urls))
+    results: list[Optional[str]] = [None] * len(wav_urls)
+
+    usable = []
+    for i, (wav_url, call) in enumerate(zip(wav_urls, calls)):
+        if call is None:
+            continue
+        transcript = call["transcript"]
+
+        if len(transcript.strip()) < 10:
             logger.warning(f"  ❌ No usable speech detected (transcript: '{transcript}')")
 
             if not ANALYZE_ONLY and client and message_ts and channel:
@@ -222,49 +629,58 @@ def process_wav_url(wav_url: str, message_ts: str = "", channel: str = "",
                 except Exception:
                     pass
 
-            return "❌ No speech detected"
+            results[i] = "❌ No speech detected"
+            continue
 
         logger.info(f"  📝 Transcript ({len(transcript)} chars):")
         logger.info(f"     {transcript[:600]}{'...' if len(transcript) > 600 else ''}")
+        usable.append(i)
 
-        # Analyze with LLM
-        logger.info("  🤖 Running QA analysis...")
-        analysis = analyze_transcript(transcript)
-
-        grade_emojis = extract_grade_emojis(analysis)
-        grade_str = " ".join(f":{e}:" for e in grade_emojis) if grade_emojis else "???"
-
-        logger.info(f"  📊 GRADE: {grade_str}")
-        logger.info(f"  📊 ANALYSIS: {analysis}")
+    pending = [i for i in usable if not calls[i]["analysis"]]
+    reacted = set()
+    if pending:
+        def react_early(emoji_names):
+            for emoji_name in emoji_names:
+                add_reaction(client, channel, message_ts, emoji_name)
+                reacted.add(emoji_name)
 
-        # Production mode: react and reply in Slack
-        if not ANALYZE_ONLY and client and say and message_ts and channel:
-            for emoji_name in grade_emojis:
-                try:
-                    client.reactions_add(channel=channel, name=emoji_name, timestamp=message_ts)
-                    logger.info(f"    ✅ Reacted: :{emoji_name}:")
-                except Exception as e:
-                    logger.warning(f"    ⚠️ Reaction failed ({emoji_name}): {e}")
+        # Perceived-latency win: react the moment the grade streams in
+        live = not ANALYZE_ONLY and client and message_ts and channel
+        on_grade = react_early if live else None
 
-            short_url = wav_url.split("/")[-1] if "/" in wav_url else wav_url
-            reply_text = (
-                f"*QA Analysis for* `{short_url}`\n\n"
-                f"*Transcript:*\n>>> {transcript[:1500]}{'...' if len(transcript) > 1500 else ''}\n\n"
-                f"*Assessment:*\n{analysis}"
-            )
-            say(text=reply_text, thread_ts=message_ts)
+        # Analyze with LLM
+        logger.info(f"  🤖 Running QA analysis ({len(pending)} call(s))...")
+        try:
+            analyses = analyze_transcripts([calls[i]["transcript"] for i in pending],
+                                           on_grade=on_grade)
+        except Exception as e:
+            logger.exception(f"  ❌ QA analysis failed: {e}")
+            analyses = [None] * len(pending)
+
+        for i, analysis in zip(pending, analyses):
+            calls[i]["analysis"] = analysis
+            if analysis:
+                store_cached_result(calls[i]["digest"], calls[i]["transcript"], analysis)
+
+    for i in usable:
+        if not calls[i]["analysis"]:
+            continue
+        try:
+            report_analysis(wav_urls[i], calls[i]["transcript"], calls[i]["analysis"],
+                            message_ts=message_ts, channel=channel, say=say, client=client,
+                            reacted=frozenset(reacted))
+            results[i] = calls[i]["analysis"]
+        except Exception as e:
+            logger.exception(f"  ❌ Error reporting {wav_urls[i]}: {e}")
+
+    return results
 
-        return analysis
 
-    except Exception as e:
-        logger.exception(f"  ❌ Error processing {wav_url}: {e}")
-        return None
-    finally:
-        if tmp_path:
-            try:
-                os.unlink(tmp_path)
-            except Exception:
-                pass
+def process_wav_url(wav_url: str, message_ts: str = "", channel: str = "",
+                    say=None, client=None):
+    """Download → Transcribe → Analyze a single .wav URL."""
+    return process_wav_urls([wav_url], message_ts=message_ts, channel=channel,
+                            say=say, client=client)[0]
 
 
 # ─── Startup: Fetch & Analyze Latest Message ────────────────────────────────
@@ -292,10 +708,43 @@ def process_latest_message(channel_id: str):
         logger.error(f"Failed to fetch messages: {e}")
 
 
+# ─── Background Workers ──────────────────────────────────────────────────────
+
+# Bolt already acks events and runs listeners on its own executor; this bounded queue
+# caps pipeline concurrency at QA_WORKERS and sheds load once JOB_QUEUE_SIZE are waiting
+job_queue: queue.Queue = queue.Queue(maxsize=JOB_QUEUE_SIZE)
+
+
+def job_worker():
+    """Run queued (func, args, kwargs) jobs forever."""
+    while True:
+        func, args, kwargs = job_queue.get()
+        try:
+            func(*args, **kwargs)
+        except Exception as e:
+            logger.exception(f"  ❌ Background job failed: {e}")
+        finally:
+            job_queue.task_done()
+
+
+def enqueue_job(func, *args, **kwargs) -> bool:
+    """Queue a job without blocking; returns False (job not queued) if the backlog is full."""
+    try:
+        job_queue.put_nowait((func, args, kwargs))
+        return True
+    except queue.Full:
+        return False
+
+
+def start_workers():
+    for n in range(QA_WORKERS):
+        threading.Thread(target=job_worker, name=f"qa-worker-{n}", daemon=True).start()
+
+
 # ─── Event Handler ───────────────────────────────────────────────────────────
 
 @app.event("message")
-def handle_message(event, say, client):
+def handle_message(event, say, client, context):
     channel = event.get("channel", "")
     user = event.get("user", "unknown")
     text = event.get("text", "")
@@ -304,6 +753,11 @@ def handle_message(event, say, client):
     if QA_CHANNEL_ID and channel != QA_CHANNEL_ID:
         return
 
+    # Never grade our own analysis replies (they can quote the original URL)
+    bot_id = event.get("bot_id")
+    if bot_id and bot_id == context.get("bot_id"):
+        return
+
     wav_urls = extract_wav_urls(text)
 
     if not wav_urls:
@@ -313,13 +767,30 @@ def handle_message(event, say, client):
     logger.info(f"\n📨 NEW WAV MESSAGE | User: {user} | ts: {ts}")
     logger.info(f"   Found {len(wav_urls)} .wav URL(s)")
 
-    process_wav_url(
-        wav_urls[0],
-        message_ts=ts,
-        channel=channel,
-        say=say,
-        client=client,
-    )
+    dropped = []
+    for start in range(0, len(wav_urls), BATCH_SIZE):
+        batch = wav_urls[start:start + BATCH_SIZE]
+        queued = enqueue_job(
+            process_wav_urls,
+            batch,
+            message_ts=ts,
+            channel=channel,
+            say=say,
+            client=client,
+        )
+        if not queued:
+            dropped.extend(batch)
+
+    if dropped:
+        logger.warning(f"  ⚠️ Job queue full ({JOB_QUEUE_SIZE}) — dropped {len(dropped)} WAV(s) "
+                       f"from ts {ts}: {', '.join(dropped)}")
+        if not ANALYZE_ONLY:
+            add_reaction(client, channel, ts, "warning")
+            names = ", ".join(f"`{url.split('/')[-1]}`" for url in dropped)
+            try:
+                say(text=f"⚠️ QA bot is busy — skipped {names}. Re-post to retry.", thread_ts=ts)
+            except Exception as e:
+                logger.warning(f"    ⚠️ Busy reply failed: {e}")
 
 
 # ─── Entrypoint ──────────────────────────────────────────────────────────────
@@ -331,6 +802,10 @@ if __name__ == "__main__":
     logger.info(f"   Whisper: {WHISPER_MODEL_SIZE}")
     logger.info(f"   Channel: {QA_CHANNEL_ID or 'ALL'}")
 
+    # Load the LLM while we connect to Slack so the first call skips the cold start
+    warmup_pool.submit(warm_up_llm)
+    start_workers()
+
     if ANALYZE_ONLY:
         logger.info("\n   ⚠️  ANALYZE_ONLY=True — no reactions/replies, log only")
         logger.info("   ⚠️  Set ANALYZE_ONLY=False for production\n")